@@ -18,6 +18,7 @@
 """Marshmallow fields for use with JSON-LD."""
 
 import copy
+import functools
 import logging
 import types
 import typing
@@ -33,6 +34,9 @@ from calamus.utils import ONTOLOGY_QUERY, Proxy, normalize_type, normalize_value
 
 logger = logging.getLogger("calamus")
 
+# decoded JSON-LD only ever contains plain lists, no need for the slower ABC based ``utils.is_collection``
+_LIST_TYPES = (list, tuple)
+
 
 @total_ordering
 class IRIReference(object):
@@ -42,13 +46,16 @@ class IRIReference(object):
         namespace (Namespace): The ``Namespace`` this IRI is part of.
         name (str): the property name of this IRI."""
 
+    __slots__ = ("namespace", "name", "_expanded")
+
     def __init__(self, namespace, name):
         self.namespace = namespace
         self.name = name
+        self._expanded = "{namespace}{name}".format(namespace=namespace, name=name)
 
     def __str__(self):
         """Return expanded string for IRI."""
-        return "{namespace}{name}".format(namespace=self.namespace, name=self.name)
+        return self._expanded
 
     def __repr__(self):
         """Representation of IRI."""
@@ -56,19 +63,17 @@ class IRIReference(object):
 
     def __eq__(self, other):
         """Check equality between this and an other IRIReference."""
-        expanded = str(self)
-
         if isinstance(other, IRIReference):
-            other = str(other)
+            other = other._expanded
 
-        return expanded == other
+        return self._expanded == other
 
     def __lt__(self, other):
         """Compare this with another IRI."""
-        return str(self) < str(other)
+        return self._expanded < str(other)
 
     def __hash__(self):
-        return str(self).__hash__()
+        return self._expanded.__hash__()
 
 
 class Namespace(object):
@@ -100,6 +105,9 @@ class Namespace(object):
             if not next(iter(qres), False):
                 raise ValueError(f"Property {name} does not exist in namespace {self.namespace}")
 
+        # cache the reference on the instance so later lookups don't go through ``__getattr__`` again
+        self.__dict__[name] = reference
+
         return reference
 
     def __str__(self):
@@ -116,6 +124,11 @@ class _JsonLDField(fields.Field):
         add_value_types (bool): Whether to add xsd value type information when serializing.
     """
 
+    # xsd type used to wrap serialized values when ``add_value_types`` is set, ``None`` for fields without one
+    _XSD_TYPE = None
+    # xsd type actually added on serialization, resolved once the field is bound to its schema
+    _value_type = None
+
     def __init__(self, field_name=None, *args, **kwargs):
         if "default" in kwargs:
             kwargs["load_default"] = kwargs.get("default")
@@ -127,24 +140,33 @@ class _JsonLDField(fields.Field):
         }
         super().__init__(*args, **filtered_kwargs)
         self.field_name = field_name
+        self.data_key = str(field_name) if field_name is not None else None
 
         self.reverse = kwargs.get("reverse", False)
         self.init_name = kwargs.get("init_name", None)
         self.add_value_types = kwargs.get("add_value_types", False)
 
-    @property
-    def data_key(self):
-        """Return the (expanded) JsonLD field name."""
-        if self.field_name is None:
+    def _bind_to_schema(self, field_name, schema):
+        super()._bind_to_schema(field_name, schema)
+
+        if self.data_key is None and isinstance(schema, SchemaABC):
             raise ValueError("field_name was not set for {} in schema {}".format(self.name, self.root.__class__))
-        return str(self.field_name)
 
-    @data_key.setter
-    def data_key(self, value):
-        pass
+        if self._XSD_TYPE is not None:
+            opts = getattr(self.parent, "opts", None)
+            if self.add_value_types or getattr(opts, "add_value_types", False):
+                self._value_type = self._XSD_TYPE
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        value = super()._serialize(value, attr, obj, **kwargs)
+        if self._value_type is not None:
+            value = {"@value": value, "@type": self._value_type}
+        return value
 
     def _deserialize(self, value, attr, data, **kwargs):
-        value = normalize_value(value)
+        if isinstance(value, (list, dict)):
+            # only lists and value objects need normalizing, plain scalars are used as is
+            value = normalize_value(value)
         return super()._deserialize(value, attr, data, **kwargs)
 
     def _reversed_fields(self):
@@ -164,6 +186,7 @@ class BlankNodeId(_JsonLDField, fields.String):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.data_key = "@id"
 
     def _serialize(self, value, attr, obj, **kwargs):
         value = super()._serialize(value, attr, obj, **kwargs)
@@ -175,28 +198,15 @@ class BlankNodeId(_JsonLDField, fields.String):
             value = value[2:]
         return super()._deserialize(value, attr, data, **kwargs)
 
-    @property
-    def data_key(self):
-        """Return the (expanded) JsonLD field name."""
-        return "@id"
-
-    @data_key.setter
-    def data_key(self, value):
-        pass
-
 
 class String(_JsonLDField, fields.String):
     """A string field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#string"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#string"}
-        return value
-
 
 class IRI(String):
     """An external IRI reference."""
@@ -205,15 +215,21 @@ class IRI(String):
         super().__init__(*args, **kwargs)
 
     def _serialize(self, value, attr, obj, **kwargs):
-        if self.parent.opts.add_value_types or self.add_value_types:
+        if self._value_type is not None:
             return {"@id": value}
 
-        value = super()._serialize(value, attr, obj, **kwargs)
+        # same as ``String._serialize`` without going through the field hierarchy
+        if value is None:
+            return None
+        value = str(value)
         if value:
             return {"@id": value}
 
     def _deserialize(self, value, attr, data, **kwargs):
-        if "@id" in value:
+        if isinstance(value, list) and len(value) == 1:
+            # single values can be single element lists in jsonld
+            value = value[0]
+        if isinstance(value, dict) and "@id" in value:
             value = value["@id"]
         return super()._deserialize(value, attr, data, **kwargs)
 
@@ -221,71 +237,57 @@ class IRI(String):
 class Integer(_JsonLDField, fields.Integer):
     """An integer field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#integer"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#integer"}
-        return value
-
 
 class Float(_JsonLDField, fields.Float):
     """A float field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#float"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#float"}
-        return value
-
 
 class Boolean(_JsonLDField, fields.Boolean):
     """A Boolean field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#boolean"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#boolean"}
-        return value
-
 
 class DateTime(_JsonLDField, fields.DateTime):
     """A date/time field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#dateTime"
+
     def __init__(self, *args, extra_formats=("%Y-%m-%d",), **kwargs):
         super().__init__(*args, **kwargs)
         self._extra_formats = extra_formats
-
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#dateTime"}
-        return value
+        self._extra_parsers = tuple(
+            self.DESERIALIZATION_FUNCS.get(format)
+            or functools.partial(self._make_object_from_format, data_format=format)
+            for format in extra_formats
+        )
 
     def _deserialize(self, value, attr, data, **kwargs):
+        value = normalize_value(value)
         try:
-            return super()._deserialize(value, attr, data, **kwargs)
+            return super(_JsonLDField, self)._deserialize(value, attr, data, **kwargs)
         except ValidationError:
             pass
 
-        # Try with extra formats
-        for format in self._extra_formats:
+        # Try with extra formats, parsing directly instead of swapping ``self.format`` and raising ValidationErrors
+        for parse in self._extra_parsers:
             try:
-                original_format = self.format
-                self.format = format
-                return super()._deserialize(value, attr, data, **kwargs)
-            except ValidationError:
+                return parse(value)
+            except (TypeError, AttributeError, ValueError):
                 pass
-            finally:
-                self.format = original_format
 
         raise self.make_error("invalid", input=value, obj_type=self.OBJ_TYPE)
 
@@ -293,54 +295,38 @@ class DateTime(_JsonLDField, fields.DateTime):
 class NaiveDateTime(_JsonLDField, fields.NaiveDateTime):
     """A naive date/time field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#dateTime"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#dateTime"}
-        return value
-
 
 class AwareDateTime(_JsonLDField, fields.AwareDateTime):
     """A naive date/time field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#dateTime"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#dateTime"}
-        return value
-
 
 class Time(_JsonLDField, fields.Time):
     """A naive date/time field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#time"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#time"}
-        return value
-
 
 class Date(_JsonLDField, fields.Date):
     """A naive date/time field."""
 
+    _XSD_TYPE = "http://www.w3.org/2001/XMLSchema#date"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
-        if self.parent.opts.add_value_types or self.add_value_types:
-            value = {"@value": value, "@type": "http://www.w3.org/2001/XMLSchema#date"}
-        return value
-
 
 class Dict(_JsonLDField, fields.Dict):
     """A dict field."""
@@ -357,9 +343,9 @@ class Raw(_JsonLDField, fields.Raw):
 class RawJsonLD(_JsonLDField, fields.Raw):
     """A raw JSON-LD field."""
 
-    def _dereference_single_id(self, value, attr, **kwargs):
+    def _dereference_single_id(self, value, attr, all_objects):
         """Dereference a single id."""
-        data = kwargs["_all_objects"].get(value, None)
+        data = all_objects.get(value, None)
         if not data:
             raise ValueError("Couldn't dereference id {id}".format(id=value))
 
@@ -374,30 +360,53 @@ class RawJsonLD(_JsonLDField, fields.Raw):
 
         return data
 
-    def _dereference_flattened(self, value, attr, **kwargs):
-        """Dereference an id or a list of ids."""
-        if isinstance(value, list) or isinstance(value, types.GeneratorType):
-            return [self._dereference_flattened(i, attr, **kwargs) for i in value]
-        if isinstance(value, str):
-            return self._dereference_single_id(value, attr, **kwargs)
-        elif isinstance(value, dict):
-            if len(value.keys()) == 1 and "@id" in value:
-                value = self._dereference_single_id(value["@id"], attr, **kwargs)
-                for k, v in value.items():
-                    if not k.startswith("@"):
-                        value[k] = self._dereference_flattened(v, attr, **kwargs)
-                return value
+    def _dereference_flattened(self, value, attr, all_objects):
+        """Dereference an id or a list of ids.
+
+        Nested values are handled with an explicit stack instead of recursion, so deep graphs don't run into the
+        recursion limit. A reference to a node that is already being expanded further up the same path is a cycle
+        and is left as an ``{"@id": ...}`` reference, so the result stays a finite tree."""
+        dereference_single_id = self._dereference_single_id
+        # ids of the nodes on the current expansion path
+        expanding = set()
+        root = [value]
+        # (container, key) slots whose value still needs to be dereferenced, or (None, id) to leave a node's path
+        stack = [(root, 0)]
+
+        while stack:
+            container, key = stack.pop()
+            if container is None:
+                expanding.discard(key)
+                continue
+
+            value = container[key]
+
+            if isinstance(value, (list, types.GeneratorType)):
+                value = container[key] = list(value)
+                stack.extend((value, i) for i in range(len(value)))
+            elif isinstance(value, str):
+                container[key] = dereference_single_id(value, attr, all_objects)
+            elif isinstance(value, dict):
+                if len(value) == 1 and "@id" in value:
+                    id_ = value["@id"]
+                    if id_ in expanding:
+                        container[key] = {"@id": id_}
+                        continue
+                    value = container[key] = dereference_single_id(id_, attr, all_objects)
+                    expanding.add(id_)
+                    stack.append((None, id_))
+                    stack.extend((value, k) for k in value if not k.startswith("@"))
             else:
-                return value
-        else:
-            raise ValueError("Nested field needs to be a dict or an id entry/list, got {value}".format(value=value))
+                raise ValueError("Nested field needs to be a dict or an id entry/list, got {value}".format(value=value))
+
+        return root[0]
 
     def _deserialize(self, value, attr, data, **kwargs):
         """Deserialize object."""
 
         if kwargs.get("flattened", False):
             # could be id references, dereference them to continue deserialization
-            value = self._dereference_flattened(value, attr, **kwargs)
+            value = self._dereference_flattened(value, attr, kwargs["_all_objects"])
 
         return super()._deserialize(value, attr, data, **kwargs)
 
@@ -423,6 +432,8 @@ class Nested(_JsonLDField, fields.Nested):
                     raise ValueError(f"Only calamus schema is allowed in nested fields, not {n}")
 
         self.nested = nested
+        # schemas looked up by the raw ``@type`` value of loaded entries
+        self._schema_by_type = {}
 
     @property
     def schema(self):
@@ -433,19 +444,34 @@ class Nested(_JsonLDField, fields.Nested):
         if not self._schema:
             # Inherit context from parent.
             context = getattr(self.parent, "context", {})
-            self._schema = {"from": {}, "to": {}}
+            schema = {"from": {}, "to": {}, "dump": {}}
             for nest in self.nested:
                 if isinstance(nest, SchemaABC):
-                    rdf_type = str(normalize_type(nest.opts.rdf_type))
-                    model = nest.opts.model
-                    if not rdf_type or not model:
-                        raise ValueError("Both rdf_type and model need to be set on the schema for nested to work")
+                    schema_class = nest.__class__
+                elif isinstance(nest, type) and issubclass(nest, SchemaABC):
+                    schema_class = nest
+                elif not isinstance(nest, (str, bytes)):
+                    raise ValueError("Nested fields must be passed a Schema, not {}.".format(nest.__class__))
+                elif nest == "self":
+                    ret = self
+                    while not isinstance(ret, SchemaABC):
+                        ret = ret.parent
+                    schema_class = ret.__class__
+                else:
+                    schema_class = class_registry.get_class(nest)
+
+                rdf_type = str(normalize_type(schema_class.opts.rdf_type))
+                model = schema_class.opts.model
+                if not rdf_type or not model:
+                    raise ValueError("Both rdf_type and model need to be set on the schema for nested to work")
+
+                if isinstance(nest, SchemaABC):
                     _schema = copy.copy(nest)
                     _schema.context.update(context)
                     # Respect only and exclude passed from parent and re-initialize fields
                     set_class = _schema.set_class
                     if self.only is not None:
-                        if self._schema.only is not None:
+                        if _schema.only is not None:
                             original = _schema.only
                         else:  # only=None -> all fields
                             original = _schema.fields.keys()
@@ -455,27 +481,9 @@ class Nested(_JsonLDField, fields.Nested):
                         _schema.exclude = set_class(self.exclude).union(original)
                     _schema._init_fields()
                     _schema._visited = self.root._visited
-                    self._schema["from"][rdf_type] = _schema
-                    self._schema["to"][model] = _schema
+                    _schema._top_level = False
                 else:
-                    if isinstance(nest, type) and issubclass(nest, SchemaABC):
-                        schema_class = nest
-                    elif not isinstance(nest, (str, bytes)):
-                        raise ValueError("Nested fields must be passed a Schema, not {}.".format(nest.__class__))
-                    elif nest == "self":
-                        ret = self
-                        while not isinstance(ret, SchemaABC):
-                            ret = ret.parent
-                        schema_class = ret.__class__
-                    else:
-                        schema_class = class_registry.get_class(nest)
-
-                    rdf_type = str(normalize_type(schema_class.opts.rdf_type))
-                    model = schema_class.opts.model
-                    if not rdf_type or not model:
-                        raise ValueError("Both rdf_type and model need to be set on the schema for nested to work")
-
-                    self._schema["from"][rdf_type] = schema_class(
+                    _schema = schema_class(
                         many=False,
                         only=self.only,
                         exclude=self.exclude,
@@ -487,7 +495,13 @@ class Nested(_JsonLDField, fields.Nested):
                         _visited=self.root._visited,
                         _top_level=False,
                     )
-                    self._schema["to"][model] = self._schema["from"][rdf_type]
+
+                schema["from"][rdf_type] = _schema
+                schema["to"][model] = _schema
+                schema["dump"][model] = _schema.dump
+
+            # only set once fully built, so a failed build isn't cached half-way
+            self._schema = schema
         return self._schema
 
     def _serialize_single_obj(self, obj, **kwargs):
@@ -505,12 +519,11 @@ class Nested(_JsonLDField, fields.Nested):
             # resolve Proxy object
             obj = obj.__wrapped__
 
-        if type(obj) not in self.schema["to"]:
-            ValueError("Type {} not found in field {}.{}".format(type(obj), type(self.parent), self.name))
+        dump = self.schema["dump"].get(type(obj))
+        if dump is None:
+            raise ValueError("Type {} not found in field {}.{}".format(type(obj), type(self.parent), self.name))
 
-        schema = self.schema["to"][type(obj)]
-        schema._top_level = False
-        return schema.dump(obj)
+        return dump(obj)
 
     def _serialize(self, nested_obj, attr, obj, many=False, **kwargs):
         """Deserialize a nested field with one or many values."""
@@ -534,10 +547,8 @@ class Nested(_JsonLDField, fields.Nested):
 
         many = self.many or many
         if many:
-            result = []
-            for obj in nested_obj:
-                result.append(self._serialize_single_obj(obj, **kwargs))
-            return result
+            serialize_single_obj = self._serialize_single_obj
+            return [serialize_single_obj(obj, **kwargs) for obj in nested_obj]
         else:
             if utils.is_collection(nested_obj):
                 raise ValueError("Expected single value for field {} but got a collection".format(self.name))
@@ -549,18 +560,33 @@ class Nested(_JsonLDField, fields.Nested):
 
     def load_single_entry(self, value, partial):
         """Loads a single nested entry from its schema."""
-        type_ = normalize_type(value["@type"])
-
-        schema = self.schema["from"][str(type_)]
-
-        if not schema:
-            ValueError("Type {} not found in {}.{}".format(value["@type"], type(self.parent), self.data_key))
-        if not schema._all_objects and self.root._all_objects:
+        type_ = value["@type"]
+        key = tuple(type_) if isinstance(type_, list) else type_
+        schema = self._schema_by_type.get(key)
+
+        if schema is None:
+            schema = self.schema["from"].get(str(normalize_type(type_)))
+
+            if schema is None:
+                raise ValueError("Type {} not found in {}.{}".format(type_, type(self.parent), self.data_key))
+            self._schema_by_type[key] = schema
+        if self.root._all_objects:
+            # always pass on the current objects, the schemas might be reused for loading different data
             schema._all_objects = self.root._all_objects
+            schema._reverse_links = self.root._reverse_links
         schema._reversed_properties = self.root._reversed_properties
 
         if schema.lazy:
-            return Proxy(lambda: schema.load(value, unknown=self.unknown, partial=partial), schema, value)
+            all_objects = schema._all_objects
+            reverse_links = schema._reverse_links
+
+            def load():
+                # restore the objects of the data this proxy was created for, the schema might have loaded others since
+                schema._all_objects = all_objects
+                schema._reverse_links = reverse_links
+                return schema.load(value, unknown=self.unknown, partial=partial)
+
+            return Proxy(load, schema, value)
         return schema.load(value, unknown=self.unknown, partial=partial)
 
     def _load(self, value, data, partial=None, many=False):
@@ -568,13 +594,12 @@ class Nested(_JsonLDField, fields.Nested):
 
         try:
             if many:
-                if not utils.is_collection(value):
+                if not isinstance(value, _LIST_TYPES):
                     value = [value]
-                valid_data = []
-                for val in value:
-                    valid_data.append(self.load_single_entry(val, partial))
+                load_single_entry = self.load_single_entry
+                valid_data = [load_single_entry(val, partial) for val in value]
             else:
-                if utils.is_collection(value):
+                if isinstance(value, _LIST_TYPES):
                     # single values can be single element lists in jsonld
                     if len(value) > 1:
                         raise ValueError(
@@ -589,43 +614,46 @@ class Nested(_JsonLDField, fields.Nested):
             raise ValidationError(error.messages, valid_data=error.valid_data) from error
         return valid_data
 
-    def _dereference_single_id(self, value, attr, **kwargs):
-        """Dereference a single id."""
-        data = kwargs["_all_objects"].get(value, None)
-        if not data:
-            raise ValueError("Couldn't dereference id {id}".format(id=value))
+    def _dereference_flattened(self, value, attr, all_objects):
+        """Dereference an id or a list of ids."""
+        get_object = all_objects.get
+        reverse = self.reverse
+
+        def dereference(value):
+            if isinstance(value, str):
+                id_ = value
+            elif isinstance(value, dict):
+                if len(value) != 1 or "@id" not in value:
+                    return value
+                id_ = value["@id"]
+            elif isinstance(value, (list, types.GeneratorType)):
+                return [dereference(v) for v in value]
+            else:
+                raise ValueError("Nested field needs to be a dict or an id entry/list, got {value}".format(value=value))
 
-        try:
-            data = dict(data)
-        except (TypeError, ValueError):
-            raise ValueError(f"Couldn't convert value '{data}' to dictionary.")
+            data = get_object(id_, None)
+            if not data:
+                raise ValueError("Couldn't dereference id {id}".format(id=id_))
 
-        if self.reverse:
-            # we need to remove the property from the child when handling reverse nesting
-            del data[attr]
+            try:
+                data = dict(data)
+            except (TypeError, ValueError):
+                raise ValueError(f"Couldn't convert value '{data}' to dictionary.")
 
-        return data
+            if reverse:
+                # we need to remove the property from the child when handling reverse nesting
+                del data[attr]
 
-    def _dereference_flattened(self, value, attr, **kwargs):
-        """Dereference an id or a list of ids."""
-        if isinstance(value, list) or isinstance(value, types.GeneratorType):
-            return [self._dereference_flattened(i, attr, **kwargs) for i in value]
-        if isinstance(value, str):
-            return self._dereference_single_id(value, attr, **kwargs)
-        elif isinstance(value, dict):
-            if len(value.keys()) == 1 and "@id" in value:
-                return self._dereference_single_id(value["@id"], attr, **kwargs)
-            else:
-                return value
-        else:
-            raise ValueError("Nested field needs to be a dict or an id entry/list, got {value}".format(value=value))
+            return data
+
+        return dereference(value)
 
     def _deserialize(self, value, attr, data, **kwargs):
         """Deserialize nested object."""
 
         if kwargs.get("flattened", False):
             # could be id references, dereference them to continue deserialization
-            value = self._dereference_flattened(value, attr, **kwargs)
+            value = self._dereference_flattened(value, attr, kwargs["_all_objects"])
 
         return super()._deserialize(value, attr, data, **kwargs)
 
@@ -638,9 +666,7 @@ class Nested(_JsonLDField, fields.Nested):
 
         for schema in self.schema["from"].values():
             for k, v in schema._reversed_properties.items():
-                if k not in fields:
-                    fields[k] = set()
-                fields[k].update(v)
+                fields.setdefault(k, set()).update(v)
 
         return fields
 
@@ -661,13 +687,16 @@ class List(_JsonLDField, fields.List):
         self.ordered = kwargs.get("ordered", False)
 
     def _serialize(self, value, attr, obj, **kwargs):
-        value = super()._serialize(value, attr, obj, **kwargs)
+        # lists never get a value type, so skip _JsonLDField._serialize
+        value = fields.List._serialize(self, value, attr, obj, **kwargs)
         return {"@list": value} if self.ordered else value
 
     def _deserialize(self, value, attr, data, **kwargs) -> typing.List[typing.Any]:
-        if isinstance(value, dict):  # an ordered list
-            value = value["@list"]
-        return super(_JsonLDField, self)._deserialize(value, attr, data, **kwargs)
+        if isinstance(value, dict):
+            # an ordered list, or a single node/value which is a valid one element list in jsonld
+            value = value["@list"] if "@list" in value else [value]
+        # skip _JsonLDField._deserialize, the list items are normalized by the inner field
+        return fields.List._deserialize(self, value, attr, data, **kwargs)
 
     @property
     def opts(self):
@@ -18,6 +18,7 @@
 """Marshmallow schema implementation that supports JSON-LD."""
 
 import inspect
+import os
 import types
 import typing
 from collections.abc import Mapping
@@ -26,15 +27,59 @@ from uuid import uuid4
 
 from marshmallow import post_load
 from marshmallow.error_store import ErrorStore
+from marshmallow.exceptions import ValidationError
 from marshmallow.schema import Schema, SchemaMeta, SchemaOpts
-from marshmallow.utils import EXCLUDE, INCLUDE, RAISE, is_collection, missing, set_value
+from marshmallow.utils import EXCLUDE, INCLUDE, RAISE, get_value, is_collection, missing, set_value
 from pyld import jsonld
 
-from calamus.utils import Proxy, normalize_id, normalize_type, validate_field_properties
+from calamus.utils import ONTOLOGY_QUERY, Proxy, normalize_id, normalize_type, validate_field_properties
 
 _T = typing.TypeVar("_T")
 
 
+def _get_object_attribute(obj, attr, default):
+    """Same as marshmallow's ``get_value`` for objects without item access, without checking for it per field."""
+    if "." in attr:
+        return get_value(obj, attr, default)
+    return getattr(obj, attr, default)
+
+
+def _parse_graph(sources):
+    """Parse ontology sources into a single graph."""
+    from rdflib.graph import Graph
+
+    g = Graph()
+
+    for source in sources:
+        g.parse(source)
+
+    return g
+
+
+@lru_cache(maxsize=32)
+def _parse_ontology(sources):
+    """Parse ontologies into a single graph, cached by ``(source, modification time)`` pairs."""
+    return _parse_graph(source for source, _ in sources)
+
+
+def _ontology_graph(ontology):
+    """Get the graph for a list of ontology sources, reusing it if they were parsed before."""
+    if not all(isinstance(o, (str, os.PathLike)) for o in ontology):
+        # e.g. file objects, these can't be cached
+        return _parse_graph(ontology)
+
+    sources = []
+
+    for o in ontology:
+        if os.path.isfile(o):
+            # local files are keyed by absolute path, so relative paths stay correct across working directories
+            sources.append((os.path.abspath(o), os.path.getmtime(o)))
+        else:
+            sources.append((o, None))
+
+    return _parse_ontology(tuple(sources))
+
+
 def blank_node_id_strategy(ret, obj):
     """``id_generation_strategy`` that creates random blank node ids."""
     return "_:{id}".format(id=uuid4().hex)
@@ -67,6 +112,9 @@ class JsonLDSchemaOpts(SchemaOpts):
 
         self.id_generation_strategy = getattr(meta, "id_generation_strategy", blank_node_id_strategy)
 
+        # constructor parameters of ``model``, see ``JsonLDSchema._model_parameters``
+        self._model_parameters = None
+
 
 class JsonLDSchemaMeta(SchemaMeta):
     """Meta-class for a for a JsonLDSchema class."""
@@ -86,6 +134,9 @@ class JsonLDSchemaMeta(SchemaMeta):
 
         klass.opts.rdf_type = sorted(set(klass.opts.rdf_type))
 
+        # reversed properties of top-level instances, by field options, see ``JsonLDSchema.__init__``
+        klass._reversed_properties_cache = {}
+
         return klass
 
 
@@ -148,27 +199,101 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
         self.lazy = lazy
         self._top_level = _top_level
         self._all_objects = _all_objects
+        # per property index of which objects in ``_all_objects`` refer to an id, built by ``get_reverse_links``
+        self._reverse_links = {}
+
+        cls = type(self)
 
         if _visited is None:
-            _visited = set()
-        self._visited = _visited
+            # not part of collecting the reversed properties of a parent schema, so they only depend on the class and
+            # the fields being loaded. The raw ``only``/``exclude`` arguments are used, since marshmallow already moved
+            # dotted entries like ``"author.name"`` from ``self.only``/``self.exclude`` to the nested fields.
+            cache_key = tuple(
+                frozenset(option) if option is not None else None
+                for option in (only, exclude, self.load_only, self.dump_only)
+            )
+            reversed_properties = cls._reversed_properties_cache.get(cache_key)
 
-        if all(not isinstance(self, v) for v in self._visited):
-            self._visited.add(type(self))
-            self._reversed_properties = self._reversed_fields()
+            if reversed_properties is None:
+                self._visited = {cls}
+                reversed_properties = cls._reversed_properties_cache[cache_key] = self._reversed_fields()
+            else:
+                # nested schemas get the reversed properties of the root when loading, they only need their own while
+                # collecting those of the root, so they can use the cache as well
+                self._visited = None
+            self._reversed_properties = reversed_properties
         else:
-            self._reversed_properties = {}
+            self._visited = _visited
 
-        self._init_names_mapping = {}
+            # same as checking isinstance against each visited class, schema classes have no virtual subclasses
+            if self._visited.isdisjoint(cls.__mro__):
+                self._visited.add(cls)
+                self._reversed_properties = self._reversed_fields()
+            else:
+                self._reversed_properties = {}
 
         if not self.opts.rdf_type or not self.opts.model:
             raise ValueError("rdf_type and model have to be set on the Meta of schema {}".format(type(self)))
 
+        self._normalized_rdf_type = normalize_type(self.opts.rdf_type)
+        self._rdf_type_set = frozenset(self._normalized_rdf_type)
+
+    def _init_fields(self):
+        super()._init_fields()
+
+        # resolve output key and direction of each dump field once instead of on every serialized object
+        self._dump_plan = tuple(
+            (
+                attr_name,
+                field_obj,
+                field_obj.data_key if field_obj.data_key is not None else attr_name,
+                getattr(field_obj, "reverse", False),
+            )
+            for attr_name, field_obj in self.dump_fields.items()
+        )
+        # same for the input key and direction of each load field, plus the attribute the loaded value is stored
+        # under and whether that is a dotted path
+        self._load_plan = tuple(
+            (
+                attr_name,
+                field_obj,
+                field_obj.data_key if field_obj.data_key is not None else attr_name,
+                getattr(field_obj, "reverse", False),
+                field_obj.attribute or attr_name,
+                "." in (field_obj.attribute or attr_name),
+            )
+            for attr_name, field_obj in self.load_fields.items()
+        )
+        # partial field names of nested schemes by field for the last used ``partial``, see ``_sub_partials``
+        self._sub_partials_cache = None
+        # keys of loaded data that are handled by a field or are JsonLD meta fields, everything else is unknown
+        self._known_keys = frozenset(
+            field_obj.data_key if field_obj.data_key is not None else attr_name
+            for attr_name, field_obj in self.load_fields.items()
+        ).union(["@type", "@reverse"])
+        # fields that get passed to the model constructor under a different name
+        self._init_names_mapping = {
+            attr_name: field_obj.init_name
+            for attr_name, field_obj in self.load_fields.items()
+            if getattr(field_obj, "init_name", None)
+        }
+
     def _serialize(self, obj: typing.Union[_T, typing.Iterable[_T]], *, many: bool = False):
         """Serialize ``obj`` to jsonld."""
         if many and obj is not None:
-            return [self._serialize(d, many=False) for d in typing.cast(typing.Iterable[_T], obj)]
+            serialize_single_obj = self._serialize_single_obj
+            ret = [serialize_single_obj(d) for d in typing.cast(typing.Iterable[_T], obj)]
+        else:
+            ret = self._serialize_single_obj(obj)
+
+        if self.flattened and self._top_level:
+            # flatten everything at once, so multiple objects end up in a single graph
+            ret = jsonld.flatten(ret)
+
+        return ret
 
+    def _serialize_single_obj(self, obj: _T):
+        """Serialize a single object to (unflattened) jsonld."""
         if isinstance(obj, Proxy):
             proxy_schema = obj.__proxy_schema__
             if (
@@ -182,16 +307,19 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
             # resolve Proxy object
             obj = obj.__wrapped__
 
-        ret = self.dict_class()
-        for attr_name, field_obj in self.dump_fields.items():
-            value = field_obj.serialize(attr_name, obj, accessor=self.get_attribute)
+        dict_class = self.dict_class
+        accessor = self.get_attribute
+        if not hasattr(obj, "__getitem__") and type(self).get_attribute is Schema.get_attribute:
+            # plain model object, skip marshmallow's generic attribute/item lookup for every field
+            accessor = _get_object_attribute
+        ret = dict_class()
+        for attr_name, field_obj, key, reverse in self._dump_plan:
+            value = field_obj.serialize(attr_name, obj, accessor=accessor)
             if value is missing:
                 continue
-            key = field_obj.data_key if field_obj.data_key is not None else attr_name
-            reverse = getattr(field_obj, "reverse", False)
             if reverse:
                 if "@reverse" not in ret:
-                    ret["@reverse"] = self.dict_class()
+                    ret["@reverse"] = dict_class()
                 ret["@reverse"][key] = value
             else:
                 ret[key] = value
@@ -199,16 +327,8 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
         if "@id" not in ret or not ret["@id"]:
             ret["@id"] = self.opts.id_generation_strategy(ret, obj)
 
-        # add type
-        rdf_type = self.opts.rdf_type
-
-        if not rdf_type:
-            raise ValueError("No class type specified for schema")
-
-        ret["@type"] = normalize_type(rdf_type)
-
-        if self.flattened and self._top_level:
-            ret = jsonld.flatten(ret)
+        # add type, copied since the output may be modified
+        ret["@type"] = list(self._normalized_rdf_type)
 
         return ret
 
@@ -217,27 +337,22 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
 
         Used for unflattening a list.
         """
-        ret = []
-
         if not self._all_objects:
-            return ret
-
-        for d in self._all_objects.values():
-            if field_name not in d:
-                continue
-
-            if normalize_id(data["@id"])[0] in normalize_id(d[field_name]):
-                ret.append(d["@id"])
+            return []
 
-        return ret
+        links = self._reverse_links.get(field_name)
 
-    def _compare_ids(self, first, second):
-        """Compare if two ids or lists of ids match."""
+        if links is None:
+            links = {}
+            for d in self._all_objects.values():
+                if field_name not in d:
+                    continue
 
-        first = set(normalize_id(first))
-        second = set(normalize_id(second))
+                for id_ in set(normalize_id(d[field_name])):
+                    links.setdefault(id_, []).append(d["@id"])
+            self._reverse_links[field_name] = links
 
-        return first & second == first | second
+        return list(links.get(normalize_id(data["@id"])[0], ()))
 
     def _deserialize(
         self,
@@ -255,14 +370,17 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
         index_errors = self.opts.index_errors
         index = index if index_errors else None
 
-        if self.flattened and is_collection(data) and not self._all_objects:
-            self._all_objects = {}
+        if self.flattened and self._top_level and is_collection(data):
+            # index the graph on every top-level load, the schema might be reused for different data
+            all_objects = self._all_objects = {}
+            self._reverse_links = {}
+            rdf_types = self._rdf_type_set
             new_data = []
 
             for d in data:
-                self._all_objects[d["@id"]] = d
+                all_objects[d["@id"]] = d
 
-                if "@type" in d and self._compare_ids(d["@type"], self.opts.rdf_type):
+                if "@type" in d and set(normalize_id(d["@type"])) == rdf_types:
                     new_data.append(d)
 
             data = new_data
@@ -302,11 +420,18 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
                     data = data[0]
 
             partial_is_collection = is_collection(partial)
-
-            for attr_name, field_obj in self.load_fields.items():
-                field_name = field_obj.data_key if field_obj.data_key is not None else attr_name
-
-                if getattr(field_obj, "reverse", False):
+            if partial_is_collection:
+                sub_partials = self._sub_partials(partial)
+            # shared by all fields, only ``partial`` differs per field when loading partial nested schemes
+            d_kwargs = {
+                "partial": partial,
+                "_all_objects": self._all_objects,
+                "flattened": self.flattened,
+                "lazy": self.lazy,
+            }
+
+            for attr_name, field_obj, field_name, reverse, key, nested_key in self._load_plan:
+                if reverse:
                     raw_value = data.get("@reverse", missing)
                     if raw_value is not missing:
                         raw_value = raw_value.get(field_name, missing)
@@ -324,42 +449,28 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
                     if partial is True or (partial_is_collection and attr_name in partial):
                         continue
 
-                d_kwargs = {}
                 # Allow partial loading of nested schemes.
                 if partial_is_collection:
-                    prefix = field_name + "."
-                    len_prefix = len(prefix)
-                    sub_partial = [f[len_prefix:] for f in partial if f.startswith(prefix)]
-                    d_kwargs["partial"] = sub_partial
-                else:
-                    d_kwargs["partial"] = partial
-
-                d_kwargs["_all_objects"] = self._all_objects
-                d_kwargs["flattened"] = self.flattened
-                d_kwargs["lazy"] = self.lazy
-                getter = lambda val: field_obj.deserialize(val, field_name, data, **d_kwargs)
-                value = self._call_and_store(
-                    getter_func=getter,
-                    data=raw_value,
-                    field_name=field_name,
-                    error_store=error_store,
-                    index=index,
-                )
+                    d_kwargs["partial"] = sub_partials[field_name]
+
+                # same as ``_call_and_store``, without creating a getter closure for every field
+                try:
+                    value = field_obj.deserialize(raw_value, field_name, data, **d_kwargs)
+                except ValidationError as error:
+                    error_store.store_error(error.messages, field_name, index=index)
+                    # When a Nested field fails validation, the marshalled data is stored
+                    # on the ValidationError's valid_data attribute
+                    value = error.valid_data or missing
                 if value is not missing:
-                    key = field_obj.attribute or attr_name
-                    set_value(typing.cast(typing.Dict, ret), key, value)
+                    if nested_key:
+                        set_value(typing.cast(typing.Dict, ret), key, value)
+                    else:
+                        ret[key] = value
             if unknown != EXCLUDE:
-                fields = {
-                    field_obj.data_key if field_obj.data_key is not None else field_name
-                    for field_name, field_obj in self.load_fields.items()
-                }
-                for key in set(data) - fields:
-                    if key in ["@type", "@reverse"]:
-                        # ignore JsonLD meta fields
-                        continue
+                for key in data.keys() - self._known_keys:
                     # ignore property if it's reversed and used elsewhere, for flattened case
-                    if key in self._reversed_properties and any(
-                        isinstance(self, s) for s in self._reversed_properties[key]
+                    if key in self._reversed_properties and not self._reversed_properties[key].isdisjoint(
+                        type(self).__mro__
                     ):
                         continue
 
@@ -377,12 +488,25 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
                             (index if index_errors else None),
                         )
 
-        self._init_names_mapping = {
-            field_name: field_obj.init_name for field_name, field_obj in self.load_fields.items() if field_obj.init_name
-        }
-
         return ret
 
+    def _sub_partials(self, partial):
+        """Get the partial field names to pass on to each nested field.
+
+        The result only depends on ``partial``, so it's kept for loading many objects with the same ``partial``.
+        """
+        key = tuple(partial)
+
+        if self._sub_partials_cache is None or self._sub_partials_cache[0] != key:
+            sub_partials = {}
+            for _, _, field_name, *_ in self._load_plan:
+                prefix = field_name + "."
+                len_prefix = len(prefix)
+                sub_partials[field_name] = [f[len_prefix:] for f in partial if f.startswith(prefix)]
+            self._sub_partials_cache = (key, sub_partials)
+
+        return self._sub_partials_cache[1]
+
     def validate_properties(self, data, ontology, return_valid_data=False, strict=False):
         """Validate JSON-LD against an ontology.
 
@@ -391,25 +515,19 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
             ontology (str): Path/URI to an ontology file.
             return_valid_data (bool): Whether to delete invalid properties to return only valid data or else
                 returns a dict containing valid and invalid properties, Default: ``False``
-        """
-        from rdflib.graph import Graph
-        from rdflib.plugins.sparql import prepareQuery
 
+        Parsed ontologies given by path/URI are cached, local files are parsed again when they were modified.
+        """
         if isinstance(data, self.Meta.model) or all(isinstance(s, self.Meta.model) for s in data):
             data = self.dump(data)
 
-        g = Graph()
         if not isinstance(ontology, list):
             ontology = [ontology]
 
-        for o in ontology:
-            g.parse(o)
+        g = _ontology_graph(ontology)
 
         # NOTE: the query checks if the property we are passing is a property defined in the ontology
-        q = prepareQuery(
-            "ask { { ?property rdf:type <http://www.w3.org/2002/07/owl#DatatypeProperty> .} UNION { ?property rdf:type "
-            "<http://www.w3.org/2002/07/owl#ObjectProperty> .} }"
-        )
+        q = ONTOLOGY_QUERY
 
         if self.many:
             i = 0
@@ -467,6 +585,30 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
 
         return fields
 
+    def _model_parameters(self):
+        """Get the constructor parameters of the model.
+
+        Returns a tuple of ``(name, positional_only, required)`` entries and whether the constructor takes
+        ``**kwargs``. The signature is only inspected once per model and cached on the schema options.
+        """
+        model = self.opts.model
+        cached = self.opts._model_parameters
+
+        if cached is None or cached[0] is not model:
+            parameters = []
+            has_kwargs = False
+            for parameter in inspect.signature(model).parameters.values():
+                if parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
+                    # NOTE: To avoid potential errors we require positional-only arguments to always be present in data.
+                    parameters.append((parameter.name, True, True))
+                elif parameter.kind in [inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY]:
+                    parameters.append((parameter.name, False, parameter.default is inspect.Parameter.empty))
+                elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
+                    has_kwargs = True
+            cached = self.opts._model_parameters = (model, tuple(parameters), has_kwargs)
+
+        return cached[1], cached[2]
+
     @post_load
     def make_instance(self, data, **kwargs):
         """Transform loaded dict into corresponding object."""
@@ -476,27 +618,20 @@ class JsonLDSchema(Schema, metaclass=JsonLDSchemaMeta):
                 raise ValueError("Initialization name {} for {} is already in data {}".format(new_key, old_key, data))
             data[new_key] = data.pop(old_key, None)
 
-        const_args = inspect.signature(self.opts.model)
+        parameters, has_kwargs = self._model_parameters()
         keys = set(data.keys())
         args = []
         kwargs = {}
-        has_kwargs = False
-        for _, parameter in const_args.parameters.items():
-            if parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
-                # NOTE: To avoid potential errors we require positional-only arguments to always be present in data.
-                if parameter.name not in keys:
-                    raise ValueError("Field {} not found in data {}".format(parameter.name, data))
-                args.append(data[parameter.name])
-                keys.remove(parameter.name)
-            elif parameter.kind in [inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY]:
-                if parameter.name not in keys:
-                    if parameter.default is inspect.Parameter.empty:
-                        raise ValueError("Field {} not found in data {}".format(parameter.name, data))
-                else:
-                    kwargs[parameter.name] = data[parameter.name]
-                    keys.remove(parameter.name)
-            elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
-                has_kwargs = True
+        for name, positional_only, required in parameters:
+            if name not in keys:
+                if required:
+                    raise ValueError("Field {} not found in data {}".format(name, data))
+                continue
+            if positional_only:
+                args.append(data[name])
+            else:
+                kwargs[name] = data[name]
+            keys.remove(name)
         missing_data = {k: v for k, v in data.items() if k in keys}
         if has_kwargs:
             instance = self.opts.model(*args, **kwargs, **missing_data)
@@ -70,14 +70,26 @@ def normalize_id(
     """Turns a JsonLD id reference into normalized form (list of strings)."""
     if isinstance(id_object, str):
         return [id_object]
-    if isinstance(id_object, dict):
-        if "@id" not in id_object:
-            raise ValueError("No @id found in id object")
-        return [id_object["@id"]]
-    if isinstance(id_object, list) or isinstance(id_object, types.GeneratorType):
-        return [i for o in id_object for i in normalize_id(o)]
 
-    return [str(id_object)]
+    result = []
+    # walk nested lists with an explicit stack, pushing items reversed to keep their order
+    stack = [id_object]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, str):
+            result.append(obj)
+        elif isinstance(obj, dict):
+            if "@id" not in obj:
+                raise ValueError("No @id found in id object")
+            result.append(obj["@id"])
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+        elif isinstance(obj, types.GeneratorType):
+            stack.extend(reversed(list(obj)))
+        else:
+            result.append(str(obj))
+
+    return result
 
 
 def normalize_type(type_data):
@@ -91,11 +103,11 @@ def normalize_type(type_data):
 
 def normalize_value(value):
     """Normalizes a JsonLD value object to a simple value."""
-    if isinstance(value, list):
-        if len(value) == 1:
-            # single values can be single element lists in jsonld
-            return normalize_value(value[0])
-        return [normalize_value(v) for v in value]
+    while isinstance(value, list):
+        if len(value) != 1:
+            return [normalize_value(v) for v in value]
+        # single values can be single element lists in jsonld
+        value = value[0]
 
     if isinstance(value, dict) and "@value" in value:
         return value["@value"]
@@ -262,6 +262,47 @@ def test_missing_reverse_simple_deserialization():
     assert author.organization == None
 
 
+def test_nested_unknown_type_deserialization():
+    """Test that loading a nested entry with an unmapped type fails clearly."""
+
+    class Book:
+        def __init__(self, _id, author):
+            self._id = _id
+            self.author = author
+
+    class Author:
+        def __init__(self, _id):
+            self._id = _id
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class AuthorSchema(JsonLDSchema):
+        _id = fields.Id()
+
+        class Meta:
+            rdf_type = schema.Person
+            model = Author
+
+    class BookSchema(JsonLDSchema):
+        _id = fields.Id()
+        author = fields.Nested(schema.author, AuthorSchema)
+
+        class Meta:
+            rdf_type = schema.Book
+            model = Book
+
+    data = {
+        "@id": "http://example.com/books/1",
+        "@type": "http://schema.org/Book",
+        "http://schema.org/author": {"@id": "http://example.com/orgs/1", "@type": "http://schema.org/Organization"},
+    }
+
+    with pytest.raises(ValueError) as e:
+        BookSchema().load(data)
+
+    assert "not found in" in str(e.value)
+
+
 def test_nested_flattened_deserialization():
     """Test deserialization of flattened jsonld."""
 
@@ -320,6 +361,142 @@ def test_nested_flattened_deserialization():
     assert author._id == "http://example.com/authors/2"
 
 
+@pytest.mark.parametrize("lazy", [False, True])
+def test_nested_flattened_schema_reuse_deserialization(lazy):
+    """Test deserialization of different flattened jsonld documents with the same schema instance."""
+
+    class Book:
+        def __init__(self, _id, name, author):
+            self._id = _id
+            self.name = name
+            self.author = author
+
+    class Author:
+        def __init__(self, _id, name):
+            self._id = _id
+            self.name = name
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class AuthorSchema(JsonLDSchema):
+        _id = fields.Id()
+        name = fields.String(schema.name)
+
+        class Meta:
+            rdf_type = schema.Person
+            model = Author
+
+    class BookSchema(JsonLDSchema):
+        _id = fields.Id()
+        name = fields.String(schema.name)
+        author = fields.Nested(schema.author, AuthorSchema)
+
+        class Meta:
+            rdf_type = schema.Book
+            model = Book
+
+    def make_data(index):
+        return [
+            {
+                "@id": f"http://example.com/authors/{index}",
+                "@type": ["http://schema.org/Person"],
+                "http://schema.org/name": [{"@value": f"Author {index}"}],
+            },
+            {
+                "@id": f"http://example.com/books/{index}",
+                "@type": ["http://schema.org/Book"],
+                "http://schema.org/author": [{"@id": f"http://example.com/authors/{index}"}],
+                "http://schema.org/name": [{"@value": f"Book {index}"}],
+            },
+        ]
+
+    book_schema = BookSchema(flattened=True, lazy=lazy)
+
+    books = [book_schema.load(make_data(1)), book_schema.load(make_data(2))]
+
+    for index, book in enumerate(books, start=1):
+        assert book._id == f"http://example.com/books/{index}"
+        assert book.author._id == f"http://example.com/authors/{index}"
+        assert book.author.name == f"Author {index}"
+
+
+def test_nested_reverse_flattened_only_deserialization():
+    """Test that a schema created with dotted only fields doesn't change the reverse fields of a full load."""
+
+    class Organization:
+        def __init__(self, _id, name):
+            self._id = _id
+            self.name = name
+
+    class Author:
+        def __init__(self, _id, name, organizations):
+            self._id = _id
+            self.name = name
+            self.organizations = organizations
+
+    class Book:
+        def __init__(self, _id, author, publisher):
+            self._id = _id
+            self.author = author
+            self.publisher = publisher
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class OrganizationSchema(JsonLDSchema):
+        _id = fields.Id()
+        name = fields.String(schema.name)
+
+        class Meta:
+            rdf_type = schema.Organization
+            model = Organization
+
+    class AuthorSchema(JsonLDSchema):
+        _id = fields.Id()
+        name = fields.String(schema.name)
+        organizations = fields.Nested(schema.member, OrganizationSchema, reverse=True, many=True)
+
+        class Meta:
+            rdf_type = schema.Person
+            model = Author
+
+    class BookSchema(JsonLDSchema):
+        _id = fields.Id()
+        author = fields.Nested(schema.author, AuthorSchema)
+        publisher = fields.Nested(schema.publisher, OrganizationSchema)
+
+        class Meta:
+            rdf_type = schema.Book
+            model = Book
+
+    data = [
+        {
+            "@id": "http://example.com/books/1",
+            "@type": ["http://schema.org/Book"],
+            "http://schema.org/author": [{"@id": "http://example.com/authors/1"}],
+            "http://schema.org/publisher": [{"@id": "http://example.com/organizations/1"}],
+        },
+        {
+            "@id": "http://example.com/authors/1",
+            "@type": ["http://schema.org/Person"],
+            "http://schema.org/name": [{"@value": "Douglas Adams"}],
+        },
+        {
+            "@id": "http://example.com/organizations/1",
+            "@type": ["http://schema.org/Organization"],
+            "http://schema.org/name": [{"@value": "Pan Books"}],
+            "http://schema.org/member": [{"@id": "http://example.com/authors/1"}],
+        },
+    ]
+
+    # the nested author schema of this one has no reverse field
+    BookSchema(only=("_id", "author.name", "publisher"))
+
+    book = BookSchema(flattened=True, only=("_id", "author", "publisher")).load(data)
+
+    assert book.publisher.name == "Pan Books"
+    assert [o._id for o in book.author.organizations] == ["http://example.com/organizations/1"]
+
+
 def test_multiple_nested_reverse_flattened_deserialization():
     """Test deserialization of flattened jsonld."""
 
@@ -429,6 +606,26 @@ def test_iri_field_deserialization():
 
     assert a.url == None
 
+    data = {
+        "@id": "http://example.com/1",
+        "@type": ["http://schema.org/A"],
+        "http://schema.org/url": [{"@id": "http://datascience.ch"}],
+    }
+
+    a = ASchema().load(data)
+
+    assert a.url == "http://datascience.ch"
+
+    data = {
+        "@id": "http://example.com/1",
+        "@type": ["http://schema.org/A"],
+        "http://schema.org/url": "mailto:contact@idsc.ch",
+    }
+
+    a = ASchema().load(data)
+
+    assert a.url == "mailto:contact@idsc.ch"
+
 
 @pytest.mark.parametrize("value", [["1"], ["1", "2"]])
 def test_list_field_deserialization(value):
@@ -454,6 +651,32 @@ def test_list_field_deserialization(value):
     assert entity.field == value
 
 
+@pytest.mark.parametrize(
+    "value,expected", [({"@list": [{"@value": "1"}, {"@value": "2"}]}, ["1", "2"]), ({"@value": "1"}, ["1"])]
+)
+def test_list_field_dict_deserialization(value, expected):
+    """Test deserialization of List fields from ordered lists and single values."""
+
+    class Entity:
+        def __init__(self, field):
+            self.field = field
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class EntitySchema(JsonLDSchema):
+        field = fields.List(schema.field, fields.String)
+
+        class Meta:
+            rdf_type = schema.Entity
+            model = Entity
+
+    data = {"@type": ["http://schema.org/Entity"], "http://schema.org/field": value}
+
+    entity = EntitySchema().load(data)
+
+    assert entity.field == expected
+
+
 def test_init_name():
     """Test deserialization of fields with init_name."""
 
@@ -533,6 +756,68 @@ def test_alternative_date_format_deserialization(formats, value, deserialized_va
     assert str(entity.field) == deserialized_value
 
 
+def test_alternative_date_format_invalid_deserialization():
+    """Test that values not matching any DateTime format are rejected."""
+    from marshmallow.exceptions import ValidationError
+
+    class Entity:
+        def __init__(self, field):
+            self.field = field
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class EntitySchema(JsonLDSchema):
+        field = fields.DateTime(schema.field, extra_formats=["iso", "%Y-%m-%d"])
+
+        class Meta:
+            rdf_type = schema.Entity
+            model = Entity
+
+    data = {"@type": ["http://schema.org/Entity"], "http://schema.org/field": "15/06/2020"}
+
+    entity_schema = EntitySchema()
+    original_format = entity_schema.fields["field"].format
+
+    with pytest.raises(ValidationError):
+        entity_schema.load(data)
+
+    assert entity_schema.fields["field"].format == original_format
+
+
+def test_alternative_date_format_keeps_format_deserialization():
+    """Test that parsing with an extra DateTime format doesn't swap the field's format."""
+
+    class RecordingDateTime(fields.DateTime):
+        def __setattr__(self, name, value):
+            if name == "format" and hasattr(self, "format_assignments"):
+                self.format_assignments.append(value)
+            super().__setattr__(name, value)
+
+    class Entity:
+        def __init__(self, field):
+            self.field = field
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class EntitySchema(JsonLDSchema):
+        field = RecordingDateTime(schema.field, extra_formats=["%Y-%m-%d"])
+
+        class Meta:
+            rdf_type = schema.Entity
+            model = Entity
+
+    data = {"@type": ["http://schema.org/Entity"], "http://schema.org/field": "2020-06-15"}
+
+    entity_schema = EntitySchema()
+    field = entity_schema.fields["field"]
+    field.format_assignments = []
+
+    entity = entity_schema.load(data)
+
+    assert str(entity.field) == "2020-06-15 00:00:00"
+    assert field.format_assignments == []
+
+
 def test_lazy_deserialization():
     """Tests that lazy deserialization works."""
     from calamus.utils import Proxy
@@ -16,10 +16,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for Ontology Verification during serialization to python dicts Json-LD."""
+import os
+import shutil
+
 import pytest
 
 from calamus import fields
-from calamus.schema import JsonLDSchema
+from calamus.schema import JsonLDSchema, _parse_ontology
 
 
 def test_simple_verification_serialization():
@@ -83,3 +86,40 @@ def test_namespace_verification():
     # this should not throw an exception, so the test passes
     assert schema.name
     assert schema.author
+
+
+def test_ontology_parsing_cache(tmp_path, monkeypatch):
+    """Parsed ontologies are reused across calls and parsed again when the file changes."""
+
+    class Book:
+        def __init__(self, _id, name):
+            self._id = _id
+            self.name = name
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class BookSchema(JsonLDSchema):
+        _id = fields.Id()
+        name = fields.String(schema.name)
+
+        class Meta:
+            rdf_type = schema.Book
+            model = Book
+
+    book = Book(_id="http://example.com/books/1", name="The Great Gatsby")
+    ontology = tmp_path / "book_ontology.owl"
+    shutil.copy("tests/fixtures/book_ontology.owl", ontology)
+
+    BookSchema().validate_properties(book, str(ontology))
+    misses = _parse_ontology.cache_info().misses
+
+    # a relative path to the same file from another working directory reuses the parsed graph
+    monkeypatch.chdir(tmp_path)
+    BookSchema().validate_properties(book, "book_ontology.owl")
+    assert _parse_ontology.cache_info().misses == misses
+
+    mtime = os.path.getmtime(ontology)
+    os.utime(ontology, (mtime + 10, mtime + 10))
+
+    BookSchema().validate_properties(book, str(ontology))
+    assert _parse_ontology.cache_info().misses == misses + 1
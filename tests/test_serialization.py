@@ -17,6 +17,10 @@
 # limitations under the License.
 """Tests for serialization to python dicts JSON-LD."""
 
+import json
+
+import pytest
+
 import calamus.fields as fields
 from calamus.schema import JsonLDSchema, blank_node_id_strategy
 
@@ -136,6 +140,43 @@ def test_nested_reverse_serialization():
     assert book["@type"] == ["http://schema.org/Book"]
 
 
+def test_nested_unknown_type_serialization():
+    """Test that serializing a nested object of an unmapped type fails clearly."""
+
+    class Book:
+        def __init__(self, _id, author):
+            self._id = _id
+            self.author = author
+
+    class Author:
+        def __init__(self, _id):
+            self._id = _id
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class AuthorSchema(JsonLDSchema):
+        _id = fields.Id()
+
+        class Meta:
+            rdf_type = schema.Person
+            model = Author
+
+    class BookSchema(JsonLDSchema):
+        _id = fields.Id()
+        author = fields.Nested(schema.author, AuthorSchema)
+
+        class Meta:
+            rdf_type = schema.Book
+            model = Book
+
+    b = Book("http://example.com/books/1", Book("http://example.com/books/2", None))
+
+    with pytest.raises(ValueError) as e:
+        BookSchema().dump(b)
+
+    assert "not found in field" in str(e.value)
+
+
 def test_flattened_serialization():
     """Test that we can output flattened jsonld."""
 
@@ -196,6 +237,57 @@ def test_flattened_serialization():
     assert book["http://schema.org/author"][0]["@id"] == a._id
 
 
+def test_flattened_many_serialization():
+    """Test that dumping multiple objects flattened outputs a single graph."""
+
+    class Book:
+        def __init__(self, _id, name, author):
+            self._id = _id
+            self.name = name
+            self.author = author
+
+    class Author:
+        def __init__(self, _id, name):
+            self._id = _id
+            self.name = name
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class AuthorSchema(JsonLDSchema):
+        _id = fields.Id()
+        name = fields.String(schema.name)
+
+        class Meta:
+            rdf_type = schema.Person
+            model = Author
+
+    class BookSchema(JsonLDSchema):
+        _id = fields.Id()
+        name = fields.String(schema.name)
+        author = fields.Nested(schema.author, AuthorSchema)
+
+        class Meta:
+            rdf_type = schema.Book
+            model = Book
+
+    a = Author("http://example.com/authors/2", "Douglas Adams")
+    b1 = Book("http://example.com/books/1", "Hitchhikers Guide to the Galaxy", a)
+    b2 = Book("http://example.com/books/2", "The Restaurant at the End of the Universe", a)
+
+    jsonld = BookSchema(flattened=True, many=True).dump([b1, b2])
+
+    # a single graph: a flat list of nodes, with the shared author only once
+    assert isinstance(jsonld, list)
+    assert all(isinstance(e, dict) for e in jsonld)
+    assert len(jsonld) == 3
+    assert sorted(e["@id"] for e in jsonld) == sorted([b1._id, b2._id, a._id])
+
+    books = BookSchema(flattened=True, many=True).load(jsonld)
+
+    assert {b.name for b in books} == {b1.name, b2.name}
+    assert all(b.author.name == a.name for b in books)
+
+
 def test_multiple_nested_flattened_serialization():
     """Test that we can output flattened jsonld for multiple nested objects."""
 
@@ -707,3 +799,41 @@ def test_rawjsonld_deserialization():
         a.nested["http://schema.org/isPartOf"][0]["http://www.w3.org/2000/01/rdf-schema#label"][0]["@value"]
         == "sklearn.ensemble._forest.RandomForestClassifier"
     )
+
+
+def test_rawjsonld_flattened_cycle_deserialization():
+    """Tests deserialization of flattened raw JSON-LD fields containing reference cycles."""
+
+    class A(object):
+        def __init__(self, _id, raw):
+            super().__init__()
+            self._id = _id
+            self.raw = raw
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class ASchema(JsonLDSchema):
+        _id = fields.Id()
+        raw = fields.RawJsonLD("http://www.w3.org/ns/oa#hasBody")
+
+        class Meta:
+            rdf_type = schema.A
+            model = A
+
+    data = [
+        {"@id": "_:a", "@type": ["http://schema.org/A"], "http://www.w3.org/ns/oa#hasBody": [{"@id": "id1"}]},
+        {"@id": "id1", "@type": ["http://schema.org/Thing"], "http://schema.org/isPartOf": [{"@id": "id2"}]},
+        {"@id": "id2", "@type": ["http://schema.org/Thing"], "http://schema.org/isPartOf": [{"@id": "id1"}]},
+    ]
+
+    a = ASchema(flattened=True).load(data)
+
+    assert a.raw["@id"] == "id1"
+    part = a.raw["http://schema.org/isPartOf"][0]
+    assert part["@id"] == "id2"
+    assert part["http://schema.org/isPartOf"] == [{"@id": "id1"}]
+
+    # the cycle is cut, so the result is a finite tree that can be dumped and loaded again
+    dumped = ASchema(flattened=True).dump(a)
+    json.dumps(dumped)
+    assert ASchema(flattened=True).load(dumped).raw == a.raw